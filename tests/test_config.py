@@ -0,0 +1,97 @@
+"""Tests for config module."""
+
+import pytest
+
+from uv_pro.utils import config
+
+
+@pytest.fixture
+def config_path(tmp_path, monkeypatch):
+    """Point the config module at a settings.ini inside a temporary directory."""
+    config_dir = tmp_path / "uv_pro"
+    config_dir.mkdir()
+    path = config_dir / "settings.ini"
+
+    monkeypatch.setattr(config, "CONFIG_DIR", config_dir)
+    monkeypatch.setattr(config, "CONFIG_PATH", path)
+    monkeypatch.setattr(config, "_TMP_PATH", config_dir / "settings.ini.tmp")
+    monkeypatch.setattr(config, "_CACHE", {})
+    monkeypatch.setattr(config, "_LOADED", {})
+
+    return path
+
+
+class TestConfigExtraSections:
+    """Test that sections besides [Settings] survive loading the config."""
+
+    SETTINGS = (
+        "[Settings]\n"
+        "root_directory = \n"
+        "plot_size = 10 5\n"
+        "primary_color = magenta\n"
+        "\n"
+        "[Extra]\n"
+        "foo = bar\n"
+        "\n"
+    )
+
+    def test_extra_section_kept_when_loaded_twice(self, config_path):
+        """Test that a second Config() in the same process keeps the extra section."""
+        config_path.write_text(self.SETTINGS)
+
+        config.Config()
+        second = config.Config()
+
+        assert second.get("Extra", "foo") == "bar"
+        assert config_path.read_text() == self.SETTINGS
+
+    def test_extra_section_kept_when_settings_fixed(self, config_path):
+        """Test that rewriting an invalid setting does not drop the extra section."""
+        config_path.write_text(self.SETTINGS.replace("10 5", "bad"))
+
+        config.Config()
+        second = config.Config()
+
+        assert second.get("Extra", "foo") == "bar"
+        assert config_path.read_text() == self.SETTINGS
+
+    def test_valid_config_not_rewritten(self, config_path):
+        """Test that a valid settings.ini is left as written, comments included."""
+        settings = "# My settings\n" + self.SETTINGS.replace(" = ", "=")
+        config_path.write_text(settings)
+
+        config.Config()
+
+        assert config_path.read_text() == settings
+
+
+class TestGetConfig:
+    """Test the shared Config returned by get_config()."""
+
+    def test_cold_load_stats_file_once(self, config_path, monkeypatch):
+        """Test that loading a valid settings.ini stats it only once."""
+        config.Config()
+        calls = []
+        stat = config.os.stat
+
+        def counting_stat(path, *args, **kwargs):
+            calls.append(path)
+            return stat(path, *args, **kwargs)
+
+        monkeypatch.setattr(config.os, "stat", counting_stat)
+
+        config.get_config()
+
+        assert calls.count(config_path) == 1
+
+    def test_shared_until_file_changes(self, config_path):
+        """Test that get_config() reloads only after settings.ini changes."""
+        first = config.get_config()
+        assert config.get_config() is first
+
+        config_path.write_text("[Settings]\nprimary_color = blue\n")
+        second = config.get_config()
+
+        assert second is not first
+        assert second.get("Settings", "primary_color") == "blue"
+        assert config.get_config() is second
@@ -0,0 +1,33 @@
+"""Tests for filepicker module."""
+
+import os
+
+import pytest
+
+from uv_pro.utils.filepicker import FilePicker
+
+
+@pytest.fixture
+def picker(tmp_path):
+    """A FilePicker for a folder of twelve .KD files."""
+    for i in range(1, 13):
+        (tmp_path / f"file_{i}.KD").touch()
+
+    return FilePicker(tmp_path, ".KD")
+
+
+class TestFilePickerSelection:
+    """Test picking multiple files by number."""
+
+    def test_multi_selection_sorted_numerically(self, picker, monkeypatch):
+        """Test that selections with two-digit numbers are returned in numeric order."""
+        monkeypatch.setattr("builtins.input", lambda prompt: "10 2 1")
+        folder, files = picker.file_list[0]
+
+        selected = picker.pick_file(mode="multi")
+
+        assert selected == [
+            os.path.join(folder, files[0]),
+            os.path.join(folder, files[1]),
+            os.path.join(folder, files[9]),
+        ]
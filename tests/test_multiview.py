@@ -0,0 +1,37 @@
+"""Tests for multiview command module."""
+
+import pytest
+
+from uv_pro.commands.multiview import filter_files
+
+
+@pytest.fixture
+def folder(tmp_path, monkeypatch):
+    """A working directory with .KD files and other files."""
+    for name in ("abc_1.KD", "abc_2.KD", "xyz_1.KD", "notes.txt", "script.py"):
+        (tmp_path / name).touch()
+
+    monkeypatch.chdir(tmp_path)
+    return tmp_path
+
+
+class TestFilterFiles:
+    """Test filtering .KD files in the working directory."""
+
+    @pytest.mark.parametrize("mode", ["or", "and"])
+    def test_empty_filters_match_nothing(self, folder, mode):
+        """Test that an empty filter list opens no files in either mode."""
+        assert filter_files([], mode=mode) is None
+
+    def test_or_filter(self, folder):
+        """Test that files matching any filter are returned."""
+        assert filter_files(["abc", "xyz"]) == {"abc_1.KD", "abc_2.KD", "xyz_1.KD"}
+
+    def test_and_filter(self, folder):
+        """Test that only files matching every filter are returned."""
+        assert filter_files(["abc", "1"], mode="and") == {"abc_1.KD"}
+
+    @pytest.mark.parametrize("mode", ["or", "and"])
+    def test_default_filter_skips_other_files(self, folder, mode):
+        """Test that the default filter only returns .KD files."""
+        assert filter_files("*", mode=mode) == {"abc_1.KD", "abc_2.KD", "xyz_1.KD"}
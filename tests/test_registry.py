@@ -0,0 +1,24 @@
+"""Tests for command registry module."""
+
+from uv_pro.commands._parsers import subparsers
+from uv_pro.commands._registry import ALIASES, discover_commands
+
+
+class TestAliases:
+    """Test the alias table used to import only the requested command."""
+
+    def test_aliases_match_command_decorators(self):
+        """ALIASES lists exactly the aliases given to ``@command``."""
+        discover_commands([])
+        aliases = {}
+        for name, parser in subparsers.choices.items():
+            command_name = parser.prog.split()[-1]
+            if name != command_name:
+                aliases[name] = command_name
+
+        assert ALIASES == aliases
+
+    def test_aliases_point_to_command_modules(self):
+        """Each alias resolves to a module that defines the command."""
+        commands = discover_commands([])
+        assert set(ALIASES.values()) <= set(commands)
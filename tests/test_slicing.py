@@ -0,0 +1,34 @@
+"""Tests for slicing module."""
+
+import numpy as np
+import pandas as pd
+
+from uv_pro.slicing import manual_slicing
+
+
+def make_spectra(times):
+    """Build a small spectra DataFrame with the given column times."""
+    data = np.arange(2 * len(times), dtype=float).reshape(2, len(times))
+    return pd.DataFrame(data, columns=times)
+
+
+class TestManualSlicing:
+    """Test manual slicing with repeated and equidistant capture times."""
+
+    def test_keeps_every_column_at_a_repeated_time(self):
+        """A time captured twice returns both columns."""
+        spectra = make_spectra([0.0, 5.0, 5.0, 10.0])
+        result = manual_slicing(spectra, [5])
+        pd.testing.assert_frame_equal(result, spectra.iloc[:, [1, 2]])
+
+    def test_tie_goes_to_the_earlier_column(self):
+        """A time halfway between two captures picks the one seen first."""
+        spectra = make_spectra([0.0, 5.0, 5.0, 10.0])
+        result = manual_slicing(spectra, [7.5])
+        pd.testing.assert_frame_equal(result, spectra.iloc[:, [1, 2]])
+
+    def test_unsorted_repeated_times(self):
+        """Repeated times in unsorted columns are all kept, in sorted order."""
+        spectra = make_spectra([3.0, 1.0, 2.0, 1.0, 3.0])
+        result = manual_slicing(spectra, [1.5, 3])
+        pd.testing.assert_frame_equal(result, spectra.iloc[:, [1, 3, 0, 4]])
@@ -6,12 +6,12 @@ Default entry point if running the package using ``python -m uv_pro``.
 
 import sys
 
-from uv_pro.cli import CLI
+from uv_pro import cli
 
 
 def main():
     """Run uv_pro from cli script entry point."""
-    CLI()
+    cli.main()
     return 0
 
 
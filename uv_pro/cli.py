@@ -269,6 +269,14 @@ Usage: ``uvp tree``
 
 Print the root directory file tree to the console.
 
+On slow or network drives, set the ``UVP_SCAN_THREADS`` environment variable
+(e.g., ``UVP_SCAN_THREADS=8``) to search subfolders in parallel.
+
+Debugging
+=========
+Tracebacks are hidden by default. Set the ``UVP_DEBUG`` environment variable
+(e.g., ``UVP_DEBUG=1``) to show full tracebacks.
+
 Examples
 --------
 ::
@@ -293,15 +301,14 @@ Examples
 @author: David Hebert
 """
 
+import os
 import sys
 
 from rich import print
 
 from uv_pro import __author__, __version__
 from uv_pro.commands import get_args
-from uv_pro.utils.config import CONFIG, PRIMARY_COLOR
-
-sys.tracebacklimit = 0
+from uv_pro.utils.config import get_config
 
 
 class CLI:
@@ -316,11 +323,11 @@ class CLI:
 
     def __init__(self):
         self.args = get_args()
-        self.args.config = CONFIG
+        self.args.config = get_config()
         self.apply_config()
 
-        if hasattr(self.args, 'func'):
-            self.args.func(args=self.args)
+        if func := getattr(self.args, 'func', None):
+            func(args=self.args)
 
         else:
             print(self._splash())
@@ -340,7 +347,8 @@ class CLI:
             '                            ███                       ',
         ]
 
-        splash = [f'[{PRIMARY_COLOR}]{line}[/{PRIMARY_COLOR}]' for line in splash]
+        color = self.args.config.get('Settings', 'primary_color', fallback='magenta')
+        splash = [f'[{color}]{line}[/{color}]' for line in splash]
         splash.append(f'Version: {__version__}\nAuthor: {__author__}')
         splash.append('\nFor help with commands, type: uvp -h')
 
@@ -348,4 +356,7 @@ class CLI:
 
 
 def main() -> None:
+    if not os.environ.get('UVP_DEBUG'):
+        sys.tracebacklimit = 0
+
     CLI()
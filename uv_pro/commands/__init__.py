@@ -1,10 +1,18 @@
-from ._command import ArgGroup, Argument, MutuallyExclusiveGroup, command, get_args
+from ._command import (
+    ArgGroup,
+    Argument,
+    Flag,
+    MutuallyExclusiveGroup,
+    command,
+    get_args,
+)
 from ._registry import COMMANDS
 
 __all__ = [
     'get_args',
     'command',
     'Argument',
+    'Flag',
     'ArgGroup',
     'MutuallyExclusiveGroup',
     'COMMANDS',
@@ -13,7 +13,17 @@ from uv_pro.commands._parsers import main_parser, subparsers
 
 def get_args() -> argparse.Namespace:
     """Collect and parse all command-line args."""
-    return main_parser.parse_args()
+    args, extras = main_parser.parse_known_args()
+
+    if extras:
+        # Only the requested command may have been imported. Import the rest
+        # so the usage in the error message lists every command.
+        from uv_pro.commands._registry import discover_commands
+
+        discover_commands([])
+        main_parser.parse_args()
+
+    return args
 
 
 class Argument:
@@ -29,6 +39,19 @@ class Argument:
         self.kwargs = kwargs
 
 
+class Flag(Argument):
+    """
+    Helper class for adding boolean flags (``action='store_true'``) with the \
+    `@command` decorator.
+
+    Refer to :meth:`argparse.ArgumentParser.add_argument` for help with parameters \
+    and accepted keyword arguments.
+    """
+
+    def __init__(self, *name_or_flags: str, **kwargs) -> None:
+        super().__init__(*name_or_flags, action='store_true', default=False, **kwargs)
+
+
 class MutuallyExclusiveGroup:
     """
     Helper function for adding mutually exclusive arguments to the `@command` decorator.
@@ -108,7 +131,6 @@ def command(
     def _decorator(func):
         subparser: argparse.ArgumentParser = parent.add_parser(
             name=func.__name__,
-            # aliases=_get_aliases(func.__doc__),
             aliases=aliases,
             description=_get_description(func.__doc__),
             help=_get_help(func.__doc__),
@@ -167,10 +189,3 @@ def _get_description(docstring: str | None) -> str | None:
 
 def _get_help(docstring: str | None) -> str | None:
     return _parse_docstring(r'\*help :\s*(.*)', docstring)
-
-
-def _get_aliases(docstring: str | None) -> list[str]:
-    if aliases := _parse_docstring(r'\*aliases :\s*(.*)', docstring):
-        return aliases.split(', ')
-
-    return []
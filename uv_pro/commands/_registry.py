@@ -1,19 +1,53 @@
 import importlib
 import pkgutil
+import sys
 
+PACKAGE = 'uv_pro.commands'
 
-def discover_commands() -> dict:
-    """Dynamically discover and import all CLI command modules."""
-    package = 'uv_pro.commands'
-    modules = pkgutil.iter_modules(importlib.import_module(package).__path__)
-    commands = {}
+# Command aliases, used to pick the command module to import before parsing.
+# An alias missing here is still parsed correctly, since unknown commands
+# fall back to importing every command module.
+ALIASES = {
+    'p': 'process',
+    'proc': 'process',
+    'cfg': 'config',
+    'br': 'browse',
+    'mv': 'multiview',
+}
 
-    for _, module_name, _ in modules:
-        if not module_name.startswith('_'):
-            module = importlib.import_module(f'{package}.{module_name}')
-            commands[module_name] = module
 
-    return commands
+def discover_commands(argv: list[str] | None = None) -> dict:
+    """
+    Dynamically discover and import CLI command modules.
+
+    If the command given in ``argv`` (default ``sys.argv[1:]``) can be
+    determined, only that command module is imported, so only its subparser
+    is built. Otherwise (e.g., ``uvp -h`` or ``uvp``), all command modules
+    are imported.
+    """
+    modules = pkgutil.iter_modules(importlib.import_module(PACKAGE).__path__)
+    module_names = [name for _, name, _ in modules if not name.startswith('_')]
+
+    requested = _get_requested_command(sys.argv[1:] if argv is None else argv)
+    if requested in module_names:
+        module_names = [requested]
+
+    return {
+        module_name: importlib.import_module(f'{PACKAGE}.{module_name}')
+        for module_name in module_names
+    }
+
+
+def _get_requested_command(argv: list[str]) -> str | None:
+    """Get the module name of the first positional arg in ``argv``, if any."""
+    for arg in argv:
+        if not arg.startswith('-'):
+            return ALIASES.get(arg, arg)
+
+        if arg in ('-h', '--help'):
+            return None
+
+    return None
 
 
 COMMANDS = discover_commands()
@@ -10,7 +10,6 @@ from rich import print
 
 from uv_pro.commands import Argument, command
 from uv_pro.commands.multiview import filter_files
-from uv_pro.dataset import Dataset
 
 HELP = {
     'filters': 'An arbitrary number of filters',
@@ -48,6 +47,8 @@ def batch(args: argparse.Namespace) -> None:
     *desc : Batch export time traces from .KD files in the current working directory.
     *help : Batch export time traces from .KD files.
     """
+    from uv_pro.dataset import Dataset
+
     if files := filter_files(args.filters):
         files_exported = []
 
@@ -72,8 +73,7 @@ def batch(args: argparse.Namespace) -> None:
                 continue
 
         if files_exported:
-            print('Files exported:')
-            [
-                print(f'\t[repr.filename]{file}[/repr.filename]')
-                for file in files_exported
-            ]
+            files = '\n'.join(
+                f'\t[repr.filename]{file}[/repr.filename]' for file in files_exported
+            )
+            print('Files exported:', files, sep='\n')
@@ -4,19 +4,21 @@ Functions for the ``binmix`` command.
 @author: David Hebert
 """
 
+from __future__ import annotations
+
 import argparse
+from typing import TYPE_CHECKING
 
-import pandas as pd
 from rich import print
 
-from uv_pro.binarymixture import BinaryMixture
-from uv_pro.commands import Argument, MutuallyExclusiveGroup, command
-from uv_pro.io.export import export_csv
-from uv_pro.plots import plot_binarymixture
+from uv_pro.commands import Argument, Flag, MutuallyExclusiveGroup, command
 from uv_pro.utils._rich import BinmixOutput, splash
 from uv_pro.utils.paths import cleanup_path
 from uv_pro.utils.prompts import checkbox
 
+if TYPE_CHECKING:
+    import pandas as pd
+
 HELP = {
     'path': """Path to a UV-vis data file (.csv format) of binary mixture spectra.""",
     'component_a': """Path to a UV-vis spectrum (.csv format) of pure component "A".""",
@@ -83,20 +85,8 @@ ARGS = [
         metavar=('MIN', 'MAX'),
         help=HELP['window'],
     ),
-    Argument(
-        '-i',
-        '--interactive',
-        action='store_true',
-        default=False,
-        help=HELP['interactive'],
-    ),
-    Argument(
-        '-ne',
-        '--no_export',
-        action='store_true',
-        default=False,
-        help=HELP['no_export'],
-    ),
+    Flag('-i', '--interactive', help=HELP['interactive']),
+    Flag('-ne', '--no_export', help=HELP['no_export']),
     MutuallyExclusiveGroup(
         Argument(
             '-cols',
@@ -129,6 +119,11 @@ def binmix(args: argparse.Namespace) -> None:
     *desc : Estimate the relative composition of two species in a binary mixture.
     *help : Fit the spectra of two species in a binary mixture.
     """
+    import pandas as pd
+
+    from uv_pro.binarymixture import BinaryMixture
+    from uv_pro.plots import plot_binarymixture
+
     mixture = pd.read_csv(args.path, index_col=0)
     component_a = pd.read_csv(args.component_a, index_col=0, usecols=[0, 1])
     component_b = pd.read_csv(args.component_b, index_col=0, usecols=[0, 1])
@@ -193,12 +188,16 @@ def binmix(args: argparse.Namespace) -> None:
             files_exported = prompt_for_export(args, fit_df, fit_specta)
 
             if files_exported:
-                print(f'\nExport location: [repr.path]{args.path.parent}[/repr.path]')
-                print('Files exported:')
-                [
-                    print(f'\t[repr.filename]{file}[/repr.filename]')
+                files = '\n'.join(
+                    f'\t[repr.filename]{file}[/repr.filename]'
                     for file in files_exported
-                ]
+                )
+                print(
+                    f'\nExport location: [repr.path]{args.path.parent}[/repr.path]',
+                    'Files exported:',
+                    files,
+                    sep='\n',
+                )
 
 
 def prompt_for_export(
@@ -221,6 +220,10 @@ def prompt_for_export(
     files_exported : list[str]
         The names of the exported files.
     """
+    import pandas as pd
+
+    from uv_pro.io.export import export_csv
+
     header = 'Export results?'
     options = ['Fitting results']
     files_exported = []
@@ -237,17 +240,17 @@ def prompt_for_export(
     if user_choices is None:
         return []
 
+    output_dir, base_filename = args.path.parent, args.path.stem
+
     if 'Fitting results' in user_choices:
         files_exported.append(
-            export_csv(
-                results, args.path.parent, args.path.stem, suffix='binmix_params'
-            )
+            export_csv(results, output_dir, base_filename, suffix='binmix_params')
         )
 
     if 'Best-fit spectra' in user_choices:
-        out = pd.DataFrame(spectra).T
+        out = pd.concat(spectra, axis=1)
         files_exported.append(
-            export_csv(out, args.path.parent, args.path.stem, suffix='binmix_fit')
+            export_csv(out, output_dir, base_filename, suffix='binmix_fit')
         )
 
     return files_exported
@@ -9,17 +9,10 @@ from pathlib import Path
 
 from uv_pro.commands import command
 from uv_pro.commands.process import process
+from uv_pro.utils.paths import get_files_in_root_dir
 from uv_pro.utils.prompts import select
 
 
-def get_files_in_root_dir(root_dir: Path, ext: str = 'KD'):
-    paths = sorted(
-        {str(p.relative_to(root_dir)) for p in root_dir.rglob(f'*.{ext}')},
-        key=str.lower,
-    )
-    return paths
-
-
 @command(aliases=['br'])
 def browse(args: argparse.Namespace) -> None:
     """
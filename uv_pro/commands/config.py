@@ -7,7 +7,7 @@ Functions for the ``config`` command.
 import argparse
 from typing import Callable
 
-from uv_pro.commands import Argument, MutuallyExclusiveGroup, command
+from uv_pro.commands import Flag, MutuallyExclusiveGroup, command
 from uv_pro.utils.config import DEFAULTS, Config
 from uv_pro.utils.prompts import ask, checkbox
 
@@ -19,35 +19,13 @@ HELP = {
 }
 ARGS = [
     MutuallyExclusiveGroup(
-        Argument(
-            '--delete',
-            action='store_true',
-            default=False,
-            help=HELP['delete'],
-        ),
-        Argument(
-            '-e',
-            '--edit',
-            action='store_true',
-            default=False,
-            help=HELP['edit'],
-        ),
-        Argument(
-            '-l',
-            '--list',
-            action='store_true',
-            default=False,
-            help=HELP['list'],
-        ),
-        Argument(
-            '-r',
-            '--reset',
-            action='store_true',
-            default=False,
-            help=HELP['reset'],
-        ),
+        Flag('--delete', help=HELP['delete']),
+        Flag('-e', '--edit', help=HELP['edit']),
+        Flag('-l', '--list', help=HELP['list']),
+        Flag('-r', '--reset', help=HELP['reset']),
     )
 ]
+YES_NO = frozenset(('y', 'n'))
 
 
 @command(args=ARGS, aliases=['cfg'])
@@ -93,7 +71,11 @@ def _config_prompt(config: Config, message: str, func: Callable) -> None:
 
 
 def _delete_config(config: Config) -> None:
-    if input('Delete config file? (Y/N): ').lower() == 'y':
+    response = input('Delete config file? (Y/N): ').strip().lower()
+    while response and response not in YES_NO:
+        response = input('Y/N: ').strip().lower()
+
+    if response == 'y':
         delete = config.delete()
         if isinstance(delete, BaseException):
             print('Error deleting config.')
@@ -104,6 +86,8 @@ def _delete_config(config: Config) -> None:
 
 
 def _edit_config(config: Config, setting: str) -> None:
+    old_value = config.get('Settings', setting, raw=True)
+
     while True:
         value = ask(message=f'Enter new {setting}:')
         if value is None:
@@ -112,13 +96,20 @@ def _edit_config(config: Config, setting: str) -> None:
         config.set('Settings', setting, value)
 
         if config.validate_option(setting):
-            config._write()
+            if config.get('Settings', setting, raw=True) != old_value:
+                config._write()
             return
 
+        # An invalid value is replaced with the default; keep the old value instead.
+        config.set('Settings', setting, old_value)
+
 
 def _reset_config(config: Config, setting: str) -> None:
-    config.set('Settings', setting, DEFAULTS.get(setting))
-    config._write()
+    default = DEFAULTS.get(setting)
+
+    if config.get('Settings', setting) != default:
+        config.set('Settings', setting, default)
+        config._write()
 
 
 def _print_config(config: Config) -> None:
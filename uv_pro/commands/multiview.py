@@ -23,9 +23,10 @@ directory.
 """
 
 import argparse
-import glob
-import subprocess
-from concurrent.futures import ThreadPoolExecutor
+import fnmatch
+import os
+import re
+from concurrent.futures import ProcessPoolExecutor
 
 from uv_pro.commands import Argument, command
 
@@ -75,7 +76,8 @@ def multiview(args: argparse.Namespace) -> None:
         and open them view-only mode.
     *help : Open multiple UV-vis data files in view-only mode.
     """
-    _run_uvp_parallel(filter_files(args.filters, mode=args.filter_mode))
+    if files := filter_files(args.filters, mode=args.filter_mode):
+        _view_parallel(files)
 
 
 def filter_files(filters: list[str], mode: str = 'or') -> set[str]:
@@ -94,16 +96,26 @@ def filter_files(filters: list[str], mode: str = 'or') -> set[str]:
     files : set[str]
         The filtered files.
     """
-    search_patterns = [f'*{pattern}*.KD' for pattern in filters]
-
-    if mode == 'and':
-        files = set(glob.glob(search_patterns[0]))
-        for pattern in search_patterns[1:]:
-            files &= set(glob.glob(pattern))
-    else:
-        files = set(
-            [matches for pattern in search_patterns for matches in glob.glob(pattern)]
-        )
+    # Compile each ``*filter*.KD`` glob once. Names are case-normalized the same
+    # way glob does (case-insensitive on Windows only).
+    matchers = [
+        re.compile(fnmatch.translate(os.path.normcase(f'*{pattern}*.KD'))).match
+        for pattern in filters
+    ]
+    # No filters match no files. ``all()`` of no matchers would be True for
+    # every file, including files without a .KD suffix.
+    combine = all if mode == 'and' and matchers else any
+
+    # List the directory once and match every filter against the same names.
+    # Hidden files are skipped, as with glob.
+    with os.scandir() as entries:
+        files = {
+            entry.name
+            for entry in entries
+            if entry.is_file()
+            and not entry.name.startswith('.')
+            and combine(match(os.path.normcase(entry.name)) for match in matchers)
+        }
 
     if len(files) == 0:
         print('Error: No .KD files found with the specified filter(s).')
@@ -112,29 +124,43 @@ def filter_files(filters: list[str], mode: str = 'or') -> set[str]:
     return files
 
 
-def _run_uvp_subprocess(file: str) -> None:
+def _silence_output() -> None:
+    """Send a worker's stdout and stderr to the null device."""
+    devnull = os.open(os.devnull, os.O_WRONLY)
+    os.dup2(devnull, 1)
+    os.dup2(devnull, 2)
+    os.close(devnull)
+
+
+def _view_file(file: str) -> None:
     """
-    Run the uvp script in parallel.
+    Open a file in view-only mode (equivalent to ``uvp process file -v``).
 
     Parameters
     ----------
     file : str
         A file name.
     """
+    from uv_pro.dataset import Dataset
+    from uv_pro.plots import plot_spectra
+
     try:
-        subprocess.run(
-            ['uvp', 'process', file, '-v'],
-            stdout=subprocess.DEVNULL,
-            stderr=subprocess.STDOUT,
-        )
+        dataset = Dataset(file, view_only=True)
+        plot_spectra(dataset, dataset.raw_spectra)
 
     except Exception as e:
         print(f'An error occurred while processing the file: {str(e)}')
 
 
-def _run_uvp_parallel(files: set[str]) -> None:
+def _view_parallel(files: set[str]) -> None:
     """
-    Run the ``uvp`` script on a list of files in parallel using ThreadPoolExecutor.
+    Open a set of files in view-only mode in parallel using ProcessPoolExecutor.
+
+    Each file is plotted in its own worker process (matplotlib GUI backends \
+    are not thread-safe), which avoids starting a new ``uvp`` interpreter and \
+    re-importing its dependencies for every file. One worker is started per \
+    file (up to 50) so that the plot windows open at once. Worker output is \
+    discarded.
 
     Parameters
     ----------
@@ -142,11 +168,10 @@ def _run_uvp_parallel(files: set[str]) -> None:
         A set of file names.
     """
     try:
-        with ThreadPoolExecutor(max_workers=50) as executor:
-            executor.map(_run_uvp_subprocess, files)
-
-    except TypeError:
-        pass
+        with ProcessPoolExecutor(
+            max_workers=min(len(files), 50), initializer=_silence_output
+        ) as executor:
+            executor.map(_view_file, files)
 
     except Exception as e:
         print(f'An error occurred while processing the files: {str(e)}')
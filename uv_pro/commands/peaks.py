@@ -9,8 +9,6 @@ import argparse
 from rich import print
 
 from uv_pro.commands import Argument, command
-from uv_pro.peakfinder import PeakFinder
-from uv_pro.plots import plot_peakfinder
 from uv_pro.utils._rich import splash
 from uv_pro.utils.paths import cleanup_path, handle_args_path
 
@@ -119,6 +117,9 @@ def peaks(args: argparse.Namespace) -> None:
     *desc : UV-vis spectrum peak detection.
     *help : Find peaks in UV-vis spectra.
     """
+    from uv_pro.peakfinder import PeakFinder
+    from uv_pro.plots import plot_peakfinder
+
     print(
         '',
         splash(
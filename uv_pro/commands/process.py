@@ -4,19 +4,22 @@ Functions for the ``process`` command.
 @author: David Hebert
 """
 
+from __future__ import annotations
+
 import argparse
+from typing import TYPE_CHECKING
 
 from rich import print
 
-from uv_pro.commands import ArgGroup, Argument, MutuallyExclusiveGroup, command
-from uv_pro.dataset import Dataset
-from uv_pro.plots import plot_2x2, plot_spectra
-from uv_pro.quickfig import QuickFig
+from uv_pro.commands import ArgGroup, Argument, Flag, MutuallyExclusiveGroup, command
 from uv_pro.utils._rich import splash
 from uv_pro.utils._validate import validate_colormap
 from uv_pro.utils.paths import cleanup_path, handle_args_path
 from uv_pro.utils.prompts import checkbox
 
+if TYPE_CHECKING:
+    from uv_pro.dataset import Dataset
+
 HELP = {
     'path': """A path to a UV-vis data file (.KD format).""",
     'view': """Enable view-only mode (no data processing).""",
@@ -71,20 +74,8 @@ ARGS = [
         default=None,
         help=HELP['path'],
     ),
-    Argument(
-        '-v',
-        '--view',
-        action='store_true',
-        default=False,
-        help=HELP['view'],
-    ),
-    Argument(
-        '-ne',
-        '--no-export',
-        action='store_true',
-        default=False,
-        help=HELP['no-export'],
-    ),
+    Flag('-v', '--view', help=HELP['view']),
+    Flag('-ne', '--no-export', help=HELP['no-export']),
     Argument(
         '-tt',
         '--time-traces',
@@ -114,13 +105,7 @@ ARGS = [
         metavar='THRESHOLD',
         help=HELP['outlier-threshold'],
     ),
-    Argument(
-        '-qf',
-        '--quick-fig',
-        action='store_true',
-        default=False,
-        help=HELP['quick-fig'],
-    ),
+    Flag('-qf', '--quick-fig', help=HELP['quick-fig']),
     Argument(
         '-c',
         '--colormap',
@@ -190,13 +175,7 @@ ARGS = [
             metavar='',
             help=HELP['fit-cutoff'],
         ),
-        Argument(
-            '--global',
-            action='store_true',
-            dest='global_fit',
-            default=False,
-            help=HELP['global-fit'],
-        ),
+        Flag('--global', dest='global_fit', help=HELP['global-fit']),
         title='Kinetics & Fitting',
         description=HELP['Kinetics & Fitting'],
     ),
@@ -268,6 +247,8 @@ def process(args: argparse.Namespace) -> None:
         plot the result, and export data (optional).
     *help : Process .KD UV-vis data files.
     """
+    from uv_pro.dataset import Dataset
+
     handle_args_path(args)
 
     if args.view is True:
@@ -368,11 +349,15 @@ def prompt_for_export(dataset) -> list[str]:
 
 def _plot_and_export(args: argparse.Namespace, dataset: Dataset) -> None:
     """Plot a :class:`~uv_pro.dataset.Dataset` and prompt the user for export."""
+    from uv_pro.plots import plot_2x2, plot_spectra
+
     print('\nPlotting data...')
     if dataset.is_processed:
         files_exported = []
 
         if args.quick_fig is True:
+            from uv_pro.quickfig import QuickFig
+
             print('', splash(text='Enter ctrl-c to quit', title='uv_pro Quick Figure'))
 
             if quick_fig := QuickFig(dataset, args.colormap).exported_figure:
@@ -386,12 +371,15 @@ def _plot_and_export(args: argparse.Namespace, dataset: Dataset) -> None:
             files_exported.extend(prompt_for_export(dataset))
 
         if files_exported:
-            print(f'\nExport location: [repr.path]{args.path.parent}[/repr.path]')
-            print('Files exported:')
-            [
-                print(f'\t[repr.filename]{file}[/repr.filename]')
-                for file in files_exported
-            ]
+            files = '\n'.join(
+                f'\t[repr.filename]{file}[/repr.filename]' for file in files_exported
+            )
+            print(
+                f'\nExport location: [repr.path]{args.path.parent}[/repr.path]',
+                'Files exported:',
+                files,
+                sep='\n',
+            )
 
     else:
         plot_spectra(dataset, dataset.raw_spectra)
@@ -194,7 +194,7 @@ class Dataset:
         and traces, and performs data fitting according to the
         attributes of the :class:`~uv_pro.dataset.Dataset`.
         """
-        if len(self.raw_spectra.columns) > 2:
+        if self.raw_spectra.shape[1] > 2:
             self.time_traces = self.get_time_traces(
                 window=self.time_trace_window,
                 interval=self.time_trace_interval,
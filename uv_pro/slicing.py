@@ -1,6 +1,9 @@
 """
 Contains functions for slicing UV-vis spectra.
 
+Slicing only selects columns (spectra). It is the last processing step, applied
+after outliers are removed and the data is trimmed, so each slice is copied once.
+
 @author: David Hebert
 """
 
@@ -21,8 +24,8 @@ def slice_spectra(spectra: DataFrame, slicing: dict) -> DataFrame:
 
     Note
     ----
-    Due to integer rounding, the number of equally-spaced slices returned may \
-    differ slightly from the value given by ``slicing['slices']``.
+    Equal slicing returns exactly ``slicing['slices']`` slices, or every \
+    spectrum if ``spectra`` contains fewer than that.
 
     Parameters
     ----------
@@ -40,31 +43,27 @@ def slice_spectra(spectra: DataFrame, slicing: dict) -> DataFrame:
     sliced_spectra : :class:`pandas.DataFrame`
         The resulting spectra slices.
     """
-    if slicing['mode'] == 'equal':
-        return equal_slicing(spectra, slicing['slices'])
-
-    if slicing['mode'] == 'variable':
-        return variable_slicing(spectra, slicing['coeff'], slicing['expo'])
+    if (slicer := _SLICERS.get(slicing.get('mode'))) is None:
+        raise ValueError(f'Invalid slicing mode: `{slicing.get("mode", None)}`.')
 
-    if slicing['mode'] == 'manual':
-        return manual_slicing(spectra, slicing['times'])
-
-    raise ValueError(f'Invalid slicing mode: `{slicing.get("mode", None)}`.')
+    return slicer(spectra, slicing)
 
 
 def variable_slicing(spectra: DataFrame, coeff: float, expo: float) -> DataFrame:
     """Get unequally-spaced slices from ``spectra``."""
     _check_variable_slice_coeff(coeff)
-    slices = [0]
-    for i in range(1, len(spectra.columns)):
-        next_slice = slices[-1] + round(coeff * i**expo + 1)
-
-        if next_slice >= len(spectra.columns):
-            break
+    n = spectra.shape[1]
 
-        slices.append(next_slice)
+    # Step sizes are >= 1, so the slice positions are strictly increasing.
+    # Cumsum in float so huge steps overflow to inf instead of wrapping.
+    with np.errstate(over='ignore'):
+        steps = np.rint(coeff * np.arange(1, n, dtype=np.float64) ** expo + 1)
 
-    return spectra.iloc[:, slices]
+    slices = np.empty(steps.size + 1)
+    slices[0] = 0
+    np.cumsum(steps, out=slices[1:])
+    slices = slices[: np.searchsorted(slices, n)]
+    return spectra.take(slices.astype(np.intp), axis=1)
 
 
 def _check_variable_slice_coeff(coeff) -> None:
@@ -74,15 +73,44 @@ def _check_variable_slice_coeff(coeff) -> None:
 
 def equal_slicing(spectra: DataFrame, num_slices: int) -> DataFrame:
     """Get equally-spaced slices from ``spectra``."""
-    num_slices = min(num_slices, len(spectra.columns))
-    return spectra.iloc[
-        :, np.linspace(0, len(spectra.columns) - 1, num_slices).astype(int)
-    ]
+    n = spectra.shape[1]
+    num_slices = min(num_slices, n)
+
+    # When the slices fall on a whole-number stride, a basic slice avoids the copy.
+    if num_slices > 1 and (n - 1) % (num_slices - 1) == 0:
+        return spectra.iloc[:, :: (n - 1) // (num_slices - 1)]
+
+    idx = np.linspace(0, n - 1, num_slices, dtype=np.intp)
+    return spectra.take(idx, axis=1)
 
 
 def manual_slicing(spectra: DataFrame, times: list[int]) -> DataFrame:
     """Get the slices closest to the given ``times`` from ``spectra``."""
-    closest_times = sorted(
-        set([min(spectra.columns, key=lambda t: abs(t - time)) for time in times])
-    )
+    columns = spectra.columns.to_numpy(dtype=np.float64)
+    order = np.argsort(columns, kind='stable')
+    columns = columns[order]
+    times = np.asarray(times, dtype=np.float64)
+
+    # Compare each time to its neighbors on either side. Ties go to the
+    # neighbor whose time first appears earlier in ``spectra``.
+    right = np.searchsorted(columns, times).clip(1, len(columns) - 1)
+    left = np.maximum(right - 1, 0)
+    to_left, to_right = times - columns[left], columns[right] - times
+    first_left = order[np.searchsorted(columns, columns[left])]
+    first_right = order[np.searchsorted(columns, columns[right])]
+    left_ties = (to_left == to_right) & (first_left < first_right)
+    closest = np.where((to_left < to_right) | left_ties, left, right)
+
+    # Select by label so that every column captured at a chosen time is kept.
+    # Corrupted files can repeat capture times.
+    closest_times = spectra.columns[order[np.unique(closest)]].unique()
     return spectra[closest_times]
+
+
+_SLICERS = {
+    'equal': lambda spectra, slicing: equal_slicing(spectra, slicing['slices']),
+    'variable': lambda spectra, slicing: variable_slicing(
+        spectra, slicing['coeff'], slicing['expo']
+    ),
+    'manual': lambda spectra, slicing: manual_slicing(spectra, slicing['times']),
+}
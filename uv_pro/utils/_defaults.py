@@ -4,7 +4,10 @@ Config mapping and default values for uv_pro.
 @author: David Hebert
 """
 
+from collections.abc import Callable
 from pathlib import Path
+from types import MappingProxyType
+from typing import Any, NamedTuple
 
 from uv_pro.utils._validate import (
     validate_plot_size,
@@ -13,29 +16,41 @@ from uv_pro.utils._validate import (
 )
 from uv_pro.utils.paths import cleanup_path
 
-CONFIG_MAP = {
-    'root_directory': {
-        'section': 'Settings',
-        'type': Path,
-        'default_str': '',
-        'default_val': None,
-        'cleanup_func': cleanup_path,
-        'validate_func': validate_root_dir,
-    },
-    'plot_size': {
-        'section': 'Settings',
-        'type': lambda x: tuple(map(float, x.split())),
-        'default_str': '10 5',
-        'default_val': (10, 5),
-        'cleanup_func': lambda x: ' '.join(x.split()),
-        'validate_func': validate_plot_size,
-    },
-    'primary_color': {
-        'section': 'Settings',
-        'type': str,
-        'default_str': 'magenta',
-        'default_val': 'magenta',
-        'cleanup_func': str.strip,
-        'validate_func': validate_primary_color,
-    },
-}
+
+class ConfigEntry(NamedTuple):
+    section: str
+    type: Callable
+    default_str: str
+    default_val: Any
+    cleanup_func: Callable | None = None
+    validate_func: Callable | None = None
+
+
+CONFIG_MAP = MappingProxyType(
+    {
+        'root_directory': ConfigEntry(
+            section='Settings',
+            type=Path,
+            default_str='',
+            default_val=None,
+            cleanup_func=cleanup_path,
+            validate_func=validate_root_dir,
+        ),
+        'plot_size': ConfigEntry(
+            section='Settings',
+            type=lambda x: tuple(map(float, x.split())),
+            default_str='10 5',
+            default_val=(10, 5),
+            cleanup_func=lambda x: ' '.join(x.split()),
+            validate_func=validate_plot_size,
+        ),
+        'primary_color': ConfigEntry(
+            section='Settings',
+            type=str,
+            default_str='magenta',
+            default_val='magenta',
+            cleanup_func=str.strip,
+            validate_func=validate_primary_color,
+        ),
+    }
+)
@@ -7,10 +7,9 @@ Helper classes for rendering output with ``rich``.
 from __future__ import annotations
 
 import argparse
-from functools import partial
+from functools import cache, lru_cache
 from typing import TYPE_CHECKING
 
-import pandas as pd
 from rich import box
 from rich.columns import Columns
 from rich.console import Group, RenderableType, TextType
@@ -18,28 +17,56 @@ from rich.panel import Panel
 from rich.table import Column, Table
 from rich.text import Text
 
-from uv_pro.utils.config import PRIMARY_COLOR
+from uv_pro.utils import config
 
 if TYPE_CHECKING:
+    import pandas as pd
+
     from uv_pro.dataset import Dataset
     from uv_pro.fitting import FitResult
     from uv_pro.peakfinder import PeakFinder
 
-COLORS = {
-    'primary': PRIMARY_COLOR,
-}
 
-STYLES = {
-    'main': COLORS['primary'],
-    'bold': f'bold {COLORS["primary"]}',
-    'highlight': f'bold bright_white on {COLORS["primary"]}',
-}
+@cache
+def _styles() -> dict[str, str]:
+    # Read the primary color on first use, so importing this module (e.g., for
+    # ``uvp -h``) does not load the config file.
+    primary = config.PRIMARY_COLOR
+    return {
+        'main': primary,
+        'bold': f'bold {primary}',
+        'highlight': f'bold bright_white on {primary}',
+    }
+
+
+def __getattr__(name: str):
+    if name == 'COLORS':
+        return {'primary': _styles()['main']}
+
+    if name == 'STYLES':
+        return dict(_styles())
+
+    raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
 
 
+@lru_cache(maxsize=128)
+def _bold_text(text: str) -> Text:
+    # Rich does not modify the Text passed to a table, so equal values share one.
+    return Text(text, style=_styles()['bold'])
+
+
+@lru_cache(maxsize=256)
 def truncate_title(title: str, max_length: int = 74) -> str:
     """Truncate strings longer than ``max_length`` using elipsis."""
     half = max_length // 2
-    return title if len(title) < 74 else title[: half + 1] + '...' + title[-half:]
+    if len(title) < max_length:
+        return title
+    return title[: half + 1] + '...' + title[-half:]
+
+
+def _styled(text: TextType, style: str) -> Text:
+    # A pre-built Text is used as is; Panel copies it before rendering.
+    return text if isinstance(text, Text) else Text(text, style=style)
 
 
 def splash(text: str, title: str, width: int = 80, **kwargs) -> Panel:
@@ -56,7 +83,7 @@ def splash(text: str, title: str, width: int = 80, **kwargs) -> Panel:
 
 def table_panel(
     table: Table,
-    title: str,
+    title: TextType,
     subtitle: TextType | None = None,
     width: int = 80,
     **kwargs,
@@ -64,8 +91,8 @@ def table_panel(
     """A pre-formatted ``Panel`` for displaying tables."""
     return Panel(
         table,
-        title=Text(title, style=STYLES['highlight']),
-        subtitle=Text(subtitle, style='table.caption') if subtitle else None,
+        title=_styled(title, _styles()['highlight']),
+        subtitle=_styled(subtitle, 'table.caption') if subtitle else None,
         box=box.SIMPLE,
         width=width,
         **kwargs,
@@ -74,7 +101,7 @@ def table_panel(
 
 def fancy_panel(
     renderable: RenderableType,
-    title: str,
+    title: TextType,
     subtitle: TextType | None = None,
     width: int = 80,
     **kwargs,
@@ -82,19 +109,19 @@ def fancy_panel(
     """A fancy pre-formatted rich ``Panel``."""
     return Panel(
         renderable,
-        title=Text(title, style=STYLES['highlight']),
-        subtitle=Text.assemble(subtitle, style='table.caption') if subtitle else None,
+        title=_styled(title, _styles()['highlight']),
+        subtitle=_styled(subtitle, 'table.caption') if subtitle else None,
         box=box.ROUNDED,
         width=width,
         **kwargs,
     )
 
 
-def simple_panel(renderable: RenderableType, title: str, **kwargs) -> Panel:
+def simple_panel(renderable: RenderableType, title: TextType, **kwargs) -> Panel:
     """A simple pre-formatted rich ``Panel``."""
     return Panel(
         renderable,
-        title=Text(title, style=STYLES['highlight']),
+        title=_styled(title, _styles()['highlight']),
         title_align='center',
         expand=False,
         box=box.MINIMAL,
@@ -148,84 +175,62 @@ class ProcessingOutput:
         renderables = Group(*self.renderables)
         return renderables
 
-    def _get_subtitle(self, dataset) -> list[Text]:
+    def _get_subtitle(self, dataset: Dataset, sep: str, style: str = '') -> Text:
         subtitle = [
-            Text.assemble(
-                'Total Spectra: ',
-                (f'{len(dataset.raw_spectra.columns)}', STYLES['bold']),
-            ),
-            Text.assemble(
-                'Total time: ', (f'{dataset.spectra_times.max()} s', STYLES['bold'])
-            ),
+            'Total Spectra: ',
+            (f'{dataset.raw_spectra.shape[1]}', _styles()['bold']),
+            sep,
+            'Total time: ',
+            (f'{dataset.spectra_times.max()} s', _styles()['bold']),
         ]
 
         if dataset.cycle_time:
-            subtitle.append(
-                Text.assemble(
-                    'Cycle time: ', (f'{dataset.cycle_time} s', STYLES['bold'])
-                )
+            subtitle.extend(
+                [sep, 'Cycle time: ', (f'{dataset.cycle_time} s', _styles()['bold'])]
             )
 
-        return subtitle
+        return Text.assemble(*subtitle, style=style)
 
     def processing_panel(self, dataset: Dataset) -> Panel:
         """Create a nicely formatted rich ``Panel`` for ``dataset``."""
-        subtitle = self._get_subtitle(dataset)
-        bold_text = partial(Text, style=STYLES['bold'])
-
         if not dataset.is_processed:
-            return simple_panel(
-                Text('\n').join(subtitle),
-                title=self.title,
-            )
+            return simple_panel(self._get_subtitle(dataset, '\n'), title=self.title)
 
-        def left_table() -> Table:
-            """Shows trimming and outliers info."""
-            table = Table('', '', show_header=False, box=box.SIMPLE)
+        n_processed = dataset.processed_spectra.shape[1]
+        slicing = dataset.slicing
 
-            if dataset.trim:
-                for loc, val in zip(['start', 'end'], dataset.trim):
-                    table.add_row(f'Trimmed {loc} (s)', bold_text(f'{val}'))
+        # Trimming and outliers info.
+        left_table = Table('', '', show_header=False, box=box.SIMPLE)
+        add_left = left_table.add_row
 
-            table.add_row('Outliers found', bold_text(f'{len(dataset.outliers)}'))
+        if dataset.trim:
+            for loc, val in zip(['start', 'end'], dataset.trim):
+                add_left(f'Trimmed {loc} (s)', _bold_text(str(val)))
 
-            return table
+        add_left('Outliers found', _bold_text(str(len(dataset.outliers))))
 
-        def right_table() -> Table:
-            """Shows slicing info."""
-            table = Table('', '', show_header=False, box=box.SIMPLE)
-
-            if dataset.slicing is None:
-                table.add_row(
-                    'Spectra remaining',
-                    bold_text(f'{len(dataset.processed_spectra.columns)}'),
-                )
+        # Slicing info.
+        right_table = Table('', '', show_header=False, box=box.SIMPLE)
+        add_right = right_table.add_row
 
-            else:
-                table.add_row('Slicing mode', bold_text(f'{dataset.slicing["mode"]}'))
+        if slicing is None:
+            add_right('Spectra remaining', _bold_text(str(n_processed)))
 
-                if dataset.slicing['mode'] == 'variable':
-                    table.add_row(
-                        'Slicing coefficient', bold_text(f'{dataset.slicing["coeff"]}')
-                    )
-                    table.add_row(
-                        'Slicing exponent', bold_text(f'{dataset.slicing["expo"]}')
-                    )
+        else:
+            add_right('Slicing mode', _bold_text(str(slicing['mode'])))
 
-                table.add_row(
-                    'Slices', bold_text(f'{len(dataset.processed_spectra.columns)}')
-                )
+            if slicing['mode'] == 'variable':
+                add_right('Slicing coefficient', _bold_text(str(slicing['coeff'])))
+                add_right('Slicing exponent', _bold_text(str(slicing['expo'])))
 
-            table.add_row(
-                'Cuvette #', bold_text(f'{dataset.cell}')
-            )
+            add_right('Slices', _bold_text(str(n_processed)))
 
-            return table
+        add_right('Cuvette #', _bold_text(str(dataset.cell)))
 
         return fancy_panel(
-            Columns([left_table(), right_table()], expand=True, align='left'),
+            Columns([left_table, right_table], expand=True, align='left'),
             title=self.title,
-            subtitle=Text('\t').join(subtitle),
+            subtitle=self._get_subtitle(dataset, '\t', style='table.caption'),
         )
 
     def traces_panel(self, traces: pd.DataFrame) -> Panel:
@@ -236,14 +241,15 @@ class ProcessingOutput:
             Column('Δabs (a.u.)', justify='center', ratio=2),
         )
 
-        for wavelength in traces.columns:
-            abs_0 = traces[wavelength].iloc[0]
-            abs_f = traces[wavelength].iloc[-1]
-            table.add_row(
+        first, last = traces.iloc[0].to_numpy(), traces.iloc[-1].to_numpy()
+        add_row = table.add_row
+
+        for wavelength, abs_0, abs_f in zip(traces.columns, first, last):
+            add_row(
                 str(wavelength),
-                '{: .3f}'.format(abs_0),
-                '{: .3f}'.format(abs_f),
-                '{: .3f}'.format(abs_f - abs_0),
+                f'{abs_0: .3f}',
+                f'{abs_f: .3f}',
+                f'{abs_f - abs_0: .3f}',
             )
 
         return table_panel(table, 'Time Traces')
@@ -254,9 +260,9 @@ class ProcessingOutput:
             title = 'Initial Rates'
             labels = ['rate (a.u./s)', 'Δabs (%)', 'Δt (s)']
             keys_and_formats = [
-                (['slope', 'slope ci'], '{: .2e} ± {:.2e}'),
-                (['delta_abs_%'], '{:.2f}'),
-                (['delta_t'], '{: .1f}'),
+                (['slope', 'slope ci'], lambda slope, ci: f'{slope: .2e} ± {ci:.2e}'),
+                (['delta_abs_%'], lambda delta_abs: f'{delta_abs:.2f}'),
+                (['delta_t'], lambda delta_t: f'{delta_t: .1f}'),
             ]
             subtitle = None
 
@@ -264,9 +270,9 @@ class ProcessingOutput:
             title = 'Exponential Fit'
             labels = ['kobs (s⁻¹)', 'abs_0 (a.u.)', 'abs_f (a.u.)']
             keys_and_formats = [
-                (['kobs', 'kobs ci'], '{: .2e} ± {:.2e}'),
-                (['abs_0'], '{: .3f}'),
-                (['abs_f'], '{: .3f}'),
+                (['kobs', 'kobs ci'], lambda kobs, ci: f'{kobs: .2e} ± {ci:.2e}'),
+                (['abs_0'], lambda abs_0: f'{abs_0: .3f}'),
+                (['abs_f'], lambda abs_f: f'{abs_f: .3f}'),
             ]
             subtitle = 'Fit function: f(t) = abs_f + (abs_0 - abs_f) * exp(-kobs * t)'
 
@@ -283,27 +289,37 @@ class ProcessingOutput:
             Column('R²', justify='center', ratio=2),
         )
 
-        for wavelength in fit_result.params.columns:
-            vals = fit_result.params[wavelength]
+        params = fit_result.params
+        positions = {key: i for i, key in enumerate(params.index)}
+        formatters = [
+            (fmt, [positions[key] for key in keys]) for keys, fmt in keys_and_formats
+        ]
+        r2_position = positions['r2']
+        add_row = table.add_row
+
+        for wavelength, vals in zip(params.columns, params.to_numpy().T):
             row = [str(wavelength)]
 
-            for keys, fmt in keys_and_formats:
-                row.append(fmt.format(*[vals[k] for k in keys]))
+            for fmt, rows in formatters:
+                row.append(fmt(*vals[rows]))
 
-            r2_color = 'red' if vals.loc['r2'] < 0.85 else 'none'
-            row.append(Text('{:.4f}'.format(vals['r2']), style=r2_color))
+            r2 = vals[r2_position]
+            r2_cell = f'{r2:.4f}'
+            # Only poor fits need a styled cell.
+            row.append(Text(r2_cell, style='red') if r2 < 0.85 else r2_cell)
 
-            table.add_row(*row)
+            add_row(*row)
 
         return table_panel(table, title=f'{title} Results', subtitle=subtitle)
 
     def _unable_to_fit(self, dataset: Dataset) -> list[Text] | list:
-        chosen_wavelengths = set(dataset.chosen_traces.columns)
-        fit_wavelengths = set(dataset.fit_result.fitted_data.columns)
+        unfit_wavelengths = dataset.chosen_traces.columns.difference(
+            dataset.fit_result.fitted_data.columns
+        )
 
         unable_to_fit = [
             Text(f'Unable to fit exponential to {wavelength} nm.', style='yellow')
-            for wavelength in chosen_wavelengths.difference(fit_wavelengths)
+            for wavelength in unfit_wavelengths
         ]
 
         return unable_to_fit
@@ -350,12 +366,20 @@ class PeaksOutput:
         if self.has_epsilon:
             table.add_column('ε', justify='center')
 
-        for _, row in self.peaks.iterrows():
-            table.add_row(
-                f'{row.name}',
-                f'{row["abs"]:.3f}',
-                f'{row["epsilon"]:.3e}' if self.has_epsilon else None,
-            )
+        wavelengths = self.peaks.index.to_numpy()
+        absorbances = self.peaks['abs'].to_numpy()
+        add_row = table.add_row
+
+        if self.has_epsilon:
+            epsilons = self.peaks['epsilon'].to_numpy()
+            for wavelength, absorbance, epsilon in zip(
+                wavelengths, absorbances, epsilons
+            ):
+                add_row(f'{wavelength}', f'{absorbance:.3f}', f'{epsilon:.3e}')
+
+        else:
+            for wavelength, absorbance in zip(wavelengths, absorbances):
+                add_row(f'{wavelength}', f'{absorbance:.3f}', None)
 
         return table_panel(
             table,
@@ -418,17 +442,17 @@ class BinmixOutput:
                 expand=False,
             )
 
-            row = Text.assemble(
-                Text(f'{path.parent}\\', style=STYLES['main']),
-                Text(f'{path.name}', style=STYLES['bold']),
+            table.add_row(
+                Text.assemble(
+                    (f'{path.parent}\\', _styles()['main']),
+                    (path.name, _styles()['bold']),
+                )
             )
-
-            table.add_row(row)
             tables.append(table)
 
         return Panel(
             Columns(tables, expand=True, align='center'),
-            title=Text(self.title, style=STYLES['highlight']),
+            title=Text(self.title, style=_styles()['highlight']),
             width=80,
             box=box.SIMPLE,
             expand=False,
@@ -445,15 +469,20 @@ class BinmixOutput:
             Column('MSE', justify='center'),
         )
 
-        for label in self.results.columns:
-            vals = self.results[label]
-            table.add_row(
+        keys = ['coeff_a', 'conc_a', 'coeff_b', 'conc_b', 'MSE']
+        rows = zip(
+            self.results.columns, *[self.results.loc[key].to_numpy() for key in keys]
+        )
+        add_row = table.add_row
+
+        for label, coeff_a, conc_a, coeff_b, conc_b, mse in rows:
+            add_row(
                 label,
-                '{:.3}'.format(vals.loc['coeff_a']),
-                '{:.2e}'.format(vals.loc['conc_a']) if vals.loc['conc_a'] else '--',
-                '{:.3}'.format(vals.loc['coeff_b']),
-                '{:.2e}'.format(vals.loc['conc_b']) if vals.loc['conc_b'] else '--',
-                '{:.2e}'.format(vals.loc['MSE']),
+                f'{coeff_a:.3}',
+                f'{conc_a:.2e}' if conc_a else '--',
+                f'{coeff_b:.3}',
+                f'{conc_b:.2e}' if conc_b else '--',
+                f'{mse:.2e}',
             )
 
         return table_panel(table, title='Binary Mixture Fitting Results')
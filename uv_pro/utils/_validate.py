@@ -11,7 +11,10 @@ from pathlib import Path
 
 from rich import print
 
-from uv_pro.const import CMAPS
+_PLOT_SIZE_RE = re.compile(r'\s*\d+(?:\.\d+)?\s+\d+(?:\.\d+)?\s*')
+_VALID_COLORS = frozenset(
+    ('red', 'yellow', 'green', 'cyan', 'blue', 'magenta', 'black')
+)
 
 
 def _error_msg(error_msg: str, verbose_msg: str, verbose: bool = False) -> bool:
@@ -37,8 +40,8 @@ def validate_root_dir(root_dir: str, verbose: bool = False) -> bool:
 
 def validate_plot_size(plot_size: str, verbose: bool = False) -> bool:
     """Validate plot_size config setting. Return True if valid."""
-    pattern = re.compile(r'^\s*(\d+(?:\.\d+)?)\s+(\d+(?:\.\d+)?)\s*$')
-    if re.match(pattern, plot_size):
+    # Config values are whitespace-normalized first, so a valid size contains a space.
+    if ' ' in plot_size and _PLOT_SIZE_RE.fullmatch(plot_size):
         return True
 
     error_msg = (
@@ -52,21 +55,11 @@ def validate_plot_size(plot_size: str, verbose: bool = False) -> bool:
 
 def validate_primary_color(color: str, verbose: bool = False) -> bool:
     """Validate plot_size config setting. Return True if valid."""
-    valid_colors = {
-        'red',
-        'yellow',
-        'green',
-        'cyan',
-        'blue',
-        'magenta',
-        'black',
-    }
-    if color.lower() in valid_colors:
+    if color.lower() in _VALID_COLORS:
         return True
 
     error_msg = (
-        '[repr.error]Config error:[/repr.error] ',
-        f'Primary color {color} is invalid.',
+        f'[repr.error]Config error:[/repr.error] Primary color {color} is invalid.'
     )
 
     verbose_msg = 'Resetting to primary color to default...'
@@ -75,6 +68,8 @@ def validate_primary_color(color: str, verbose: bool = False) -> bool:
 
 
 def validate_colormap(name: str) -> str:
+    from uv_pro.const import CMAPS
+
     if name.casefold() in CMAPS.keys():
         return CMAPS[name.casefold()]
 
@@ -7,9 +7,10 @@ can be found in the user's home directory.
 @author: David Hebert
 """
 
+import io
+import os
 from configparser import ConfigParser
 from pathlib import Path
-from typing import Callable, Optional
 
 from uv_pro.utils._defaults import CONFIG_MAP
 
@@ -17,7 +18,20 @@ NAME = 'uv_pro'
 CONFIG_DIR = Path.home() / '.config' / NAME
 CONFIG_FILENAME = 'settings.ini'
 CONFIG_PATH = CONFIG_DIR / CONFIG_FILENAME
-DEFAULTS = {option: info['default_str'] for option, info in CONFIG_MAP.items()}
+_TMP_PATH = CONFIG_DIR / f'{CONFIG_FILENAME}.tmp'
+DEFAULTS = {option: entry.default_str for option, entry in CONFIG_MAP.items()}
+
+# (option, section, type, default value) for each option, in broadcast order.
+_BROADCAST_SPEC = tuple(
+    (option, entry.section, entry.type, entry.default_val)
+    for option, entry in CONFIG_MAP.items()
+)
+
+# The options of each section in the config file (including Settings), keyed by
+# the file path, mtime, and size.
+_CACHE: dict[tuple[Path, int, int], dict[str, dict[str, str]]] = {}
+# The shared Config instance, keyed by the config file mtime and size.
+_LOADED: dict[tuple[int, int], 'Config'] = {}
 
 
 class Config(ConfigParser):
@@ -26,53 +40,110 @@ class Config(ConfigParser):
     def __init__(self):
         super().__init__(defaults=DEFAULTS, default_section='Settings')
 
-        if not CONFIG_PATH.exists():
+        # One stat both checks that the file exists and keys the settings cache.
+        try:
+            stat = os.stat(CONFIG_PATH)
+
+        except FileNotFoundError:
             CONFIG_DIR.mkdir(parents=True, exist_ok=True)
             self._write()
+            return
 
-        else:
-            self.read(CONFIG_PATH)
-            self.validate(verbose=True)
+        parsed = self._read_settings(stat)
+        self.read_dict(parsed)
+        self.validate(verbose=True)
+
+        # Only rewrite the file if options were missing or invalid.
+        if _sections(self) != parsed:
             self._write()
 
+        else:
+            self._file_key = stat.st_mtime_ns, stat.st_size
+
+    def _read_settings(self, stat: os.stat_result) -> dict[str, dict[str, str]]:
+        """
+        Get the options of each section in the config file.
+
+        Parsing is skipped if the file is unchanged since it was last read.
+        """
+        key = (CONFIG_PATH, stat.st_mtime_ns, stat.st_size)
+
+        if (parsed := _CACHE.get(key)) is None:
+            parser = ConfigParser(default_section='Settings', interpolation=None)
+            parser.read_string(CONFIG_PATH.read_text(), source=str(CONFIG_PATH))
+            parsed = _CACHE[key] = _sections(parser)
+
+        return parsed
+
+    def _render(self) -> str:
+        """Get the settings as they are written to the config file."""
+        if self._sections:
+            # Let ConfigParser write any sections besides Settings.
+            buffer = io.StringIO()
+            self.write(buffer)
+            return buffer.getvalue()
+
+        # Same format as ConfigParser.write, for the Settings section only.
+        options = []
+        for option, value in self._defaults.items():
+            value = str(value).replace('\n', '\n\t')
+            options.append(f'{option} = {value}\n')
+
+        return f'[Settings]\n{"".join(options)}\n'
+
     def _write(self) -> None:
-        """Write settings to the config file."""
-        with open(CONFIG_PATH, 'w') as f:
-            self.write(f)
+        """
+        Write settings to the config file.
+
+        The settings are written to a temporary file that then replaces the
+        config file, so an interrupted write cannot leave it truncated.
+        """
+        with open(_TMP_PATH, 'w') as f:
+            f.write(self._render())
+
+        os.replace(_TMP_PATH, CONFIG_PATH)
+
+        _CACHE.clear()
+        # Record the written file, which get_config() uses to detect changes.
+        stat = os.stat(CONFIG_PATH)
+        self._file_key = stat.st_mtime_ns, stat.st_size
 
     def validate_option(self, option: str, verbose: bool = False) -> bool:
         """Validate a config value. Return True if valid."""
-        option_info = CONFIG_MAP.get(option)
-        if self.has_option('Settings', option):
-            if value := self.get('Settings', option):
-                cleanup_func: Optional[Callable] = option_info.get('cleanup_func')
-                if cleanup_func:
-                    value = cleanup_func(value)
+        entry = CONFIG_MAP[option]
+        # Settings is the default section, so its values live in ``_defaults``.
+        # Options are already lowercase and are not interpolated, so skip ``set``.
+        settings = self._defaults
 
-                validation_func: Callable = option_info.get('validate_func')
-                if validation_func(value, verbose):
-                    self.set('Settings', option, str(value))
-                    return True
+        if value := settings.get(option):
+            if entry.cleanup_func:
+                value = entry.cleanup_func(value)
 
-        self.set('Settings', option, option_info.get('default_str'))
+            if entry.validate_func(value, verbose):
+                settings[option] = str(value)
+                return True
+
+        settings[option] = entry.default_str
 
         return False
 
     def validate(self, verbose: bool = False) -> bool:
         """Validate all config values. Return True if all valid."""
-        return all(
-            [self.validate_option(option, verbose) for option in CONFIG_MAP.keys()]
-        )
+        # Not short-circuited: validate_option resets every invalid value to its default.
+        return all([self.validate_option(option, verbose) for option in CONFIG_MAP])
 
     def delete(self) -> Exception | None:
         """Delete the config file and directory."""
+        _CACHE.clear()
+        _LOADED.clear()
+
         try:
-            config_file = CONFIG_DIR / CONFIG_FILENAME
-            config_file.unlink()
+            CONFIG_PATH.unlink(missing_ok=True)
+            _TMP_PATH.unlink(missing_ok=True)
             CONFIG_DIR.rmdir()
             return
 
-        except (OSError, FileNotFoundError) as e:
+        except OSError as e:
             return e
 
     def broadcast(self) -> list[tuple]:
@@ -86,25 +157,63 @@ class Config(ConfigParser):
         list[tuple[str, Any]]
             A list of tuples with config parameter names (str) and formatted values (any).
         """
+        values = []
+
+        for option, section, type_, default_val in _BROADCAST_SPEC:
+            # Skip ConfigParser.get; the settings do not use interpolation.
+            if value := self._sections.get(section, self._defaults).get(option):
+                try:
+                    values.append((option, type_(value)))
+                    continue
+
+                except Exception as e:
+                    print(
+                        f'Warning: Could not retrieve config value for [{section}] {option}: {e}'
+                    )
+
+            values.append((option, default_val))
+
+        return values
+
+
+def _sections(parser: ConfigParser) -> dict[str, dict[str, str]]:
+    # The raw options of each section. Settings is the default section.
+    return {
+        'Settings': dict(parser.defaults()),
+        **{name: dict(options) for name, options in parser._sections.items()},
+    }
+
+
+def get_config() -> Config:
+    """Get the shared :class:`Config`, reloading it only if the config file changed."""
+    # Nothing is loaded yet on the first call, so skip the stat.
+    config = _LOADED.get(_stat_key()) if _LOADED else None
+
+    if config is None:
+        config = Config()
+        # Key on the file as Config() left it, since it may rewrite the file.
+        _LOADED.clear()
+        _LOADED[config._file_key] = config
+
+    return config
+
 
-        def get_val(
-            option: str, section: str, type: callable, default_val=None, **kwargs
-        ):
-            try:
-                if value := self.get(section, option):
-                    return type(value)
+def _stat_key() -> tuple[int, int] | None:
+    try:
+        stat = os.stat(CONFIG_PATH)
+        return stat.st_mtime_ns, stat.st_size
 
-            except Exception as e:
-                print(
-                    f'Warning: Could not retrieve config value for [{section}] {option}: {e}'
-                )
+    except FileNotFoundError:
+        return None
 
-            return default_val
 
-        return [
-            (option, get_val(option, **info)) for option, info in CONFIG_MAP.items()
-        ]
+def __getattr__(name: str):
+    # CONFIG and PRIMARY_COLOR are loaded on first use, so importing this module
+    # (e.g., for ``uvp -h``) does not read the config file.
+    if name == 'CONFIG':
+        return get_config()
 
+    if name == 'PRIMARY_COLOR':
+        return get_config().get('Settings', 'primary_color', fallback='magenta')
 
-CONFIG = Config()
-PRIMARY_COLOR = CONFIG.get('Settings', 'primary_color', fallback='magenta')
+    raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
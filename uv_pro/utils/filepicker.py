@@ -5,6 +5,8 @@ Simple utilities to view directories and pick files from the terminal.
 """
 
 import os
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor
 
 
 class FilePicker:
@@ -33,30 +35,79 @@ class FilePicker:
         """
         self.root = os.path.abspath(root)
         self.ext = file_ext
+        self._ext_lower = file_ext.lower()
         self.file_list = self._build_file_list()
+        # Menus are reprinted after each invalid choice, so build each one once.
+        self._folder_menu: str | None = None
+        self._file_menus: dict[int, str] = {}
 
     def _build_file_list(self) -> list:
         """Build the list of files with the specified extension in the root directory."""
         print(f'Searching "{self.root}" for {self.ext} files...')
 
+        if (threads := _scan_threads()) > 1:
+            walk = self._scan_parallel(self.root, threads)
+
+        else:
+            walk = self._scan(self.root)
+
         file_list = [
-            (
-                os.path.relpath(path, self.root),
-                [
-                    file
-                    for file in files
-                    if os.path.splitext(file)[1].lower() == self.ext.lower()
-                ],
-            )
-            for path, subdirs, files in os.walk(self.root)
+            (os.path.relpath(path, self.root), files) for path, files in walk if files
         ]
 
-        if file_list := [(folder, files) for folder, files in file_list if files]:
+        if file_list:
             return file_list
 
         print('No files found.')
         return None
 
+    def _scan(self, path: str) -> Iterator[tuple[str, list[str]]]:
+        # Walk top-down like os.walk: a folder's matching files, then its subfolders.
+        files, subdirs = self._list_dir(path)
+        yield path, files
+
+        for subdir in subdirs:
+            yield from self._scan(subdir)
+
+    def _scan_parallel(
+        self, path: str, threads: int
+    ) -> Iterator[tuple[str, list[str]]]:
+        # Scan the top-level subfolders on a thread pool. Results are yielded in
+        # the same order as _scan.
+        files, subdirs = self._list_dir(path)
+        yield path, files
+
+        if not subdirs:
+            return
+
+        with ThreadPoolExecutor(max_workers=min(threads, len(subdirs))) as pool:
+            for subtree in pool.map(lambda d: list(self._scan(d)), subdirs):
+                yield from subtree
+
+    def _list_dir(self, path: str) -> tuple[list[str], list[str]]:
+        ext = self._ext_lower
+        ext_len = len(ext)
+        files, subdirs = [], []
+
+        try:
+            with os.scandir(path) as entries:
+                for entry in entries:
+                    if entry.is_dir():
+                        if not entry.is_symlink():
+                            subdirs.append(entry.path)
+                        continue
+
+                    # Only the suffix is lowercased. Like splitext, names such as
+                    # '.KD' that have no stem are skipped.
+                    name = entry.name
+                    if name[-ext_len:].lower() == ext and name[:-ext_len].lstrip('.'):
+                        files.append(name)
+
+        except OSError:
+            pass
+
+        return files, subdirs
+
     def pick_file(
         self,
         mode: str = 'single',
@@ -115,45 +166,57 @@ class FilePicker:
                 ]
 
     def _print_folders_in_root(self):
-        print(f'\n{self.root}')
-        max_digits = len(str(len(self.file_list)))
+        if self._folder_menu is None:
+            lines = [f'\n{self.root}']
+            max_digits = len(str(len(self.file_list)))
 
-        for index, entry in enumerate(self.file_list, start=1):
-            extra_spacing = max_digits - len(str(index))
-            spacing = ' ' * (4 + extra_spacing)
-            print(f'[{index}]{spacing}{entry[0]}')
+            for index, entry in enumerate(self.file_list, start=1):
+                extra_spacing = max_digits - len(str(index))
+                spacing = ' ' * (4 + extra_spacing)
+                lines.append(f'[{index}]{spacing}{entry[0]}')
+
+            self._folder_menu = '\n'.join(lines)
+
+        print(self._folder_menu)
 
     def _get_folder_choice(self) -> tuple[int, str] | None:
-        try:
-            selection = input('\nSelect a folder: ')
-            accepted_range = range(1, len(self.file_list) + 1)
+        accepted_range = range(1, len(self.file_list) + 1)
 
-        except (EOFError, KeyboardInterrupt):
-            return None
+        while True:
+            try:
+                selection = input('\nSelect a folder: ')
 
-        if selection.isnumeric() and int(selection) in accepted_range:
-            folder_index = int(selection) - 1
-            folder_name = self.file_list[folder_index][0]
-            return folder_index, folder_name
+            except (EOFError, KeyboardInterrupt):
+                return None
+
+            if selection.isnumeric() and int(selection) in accepted_range:
+                folder_index = int(selection) - 1
+                folder_name = self.file_list[folder_index][0]
+                return folder_index, folder_name
 
-        else:
             self._print_folders_in_root()
             print('\nInvalid selection. Input a folder number (shown in brackets)')
-            return self._get_folder_choice()
 
     def _print_files_in_folder(self, folder_index: int, folder_name: str) -> None:
-        max_digits = len(str(len(self.file_list[folder_index][1])))
-        spacing = ' ' * (6 + max_digits)
-        print(f'\n{spacing}{folder_name}')
+        if (menu := self._file_menus.get(folder_index)) is None:
+            files = self.file_list[folder_index][1]
+            n_files = len(files)
+            max_digits = len(str(n_files))
+            spacing = ' ' * (6 + max_digits)
+            lines = [f'\n{spacing}{folder_name}']
+
+            for index, file in enumerate(files, start=1):
+                extra_spacing = max_digits - len(str(index))
+                spacing = ' ' * (4 + extra_spacing)
+
+                if index < n_files:
+                    lines.append(f'[{index}]{spacing}├───{file}\t')
+                else:
+                    lines.append(f'[{index}]{spacing}└───{file}\t')
 
-        for index, file in enumerate(self.file_list[folder_index][1], start=1):
-            extra_spacing = max_digits - len(str(index))
-            spacing = ' ' * (4 + extra_spacing)
+            menu = self._file_menus[folder_index] = '\n'.join(lines)
 
-            if index < len(self.file_list[folder_index][1]):
-                print(f'[{index}]{spacing}├───{file}\t')
-            else:
-                print(f'[{index}]{spacing}└───{file}\t')
+        print(menu)
 
     def _get_file_choice(
         self,
@@ -163,114 +226,113 @@ class FilePicker:
         min_files: int = 1,
         max_files: int = 100,
     ) -> list[str] | None:
-        try:
-            if mode == 'single':
-                prompt = '\nSelect a file: '
-                max_files = 1
+        if mode == 'single':
+            prompt = '\nSelect a file: '
+            max_files = 1
+
+        elif mode == 'multi':
+            prompt = (
+                f'\nSelect multiple {self.ext} files by entering '
+                'the numbers in brackets separated by spaces: '
+            )
 
-            elif mode == 'multi':
-                prompt = (
-                    f'\nSelect multiple {self.ext} files by entering '
-                    'the numbers in brackets separated by spaces: '
-                )
+        while True:
+            try:
+                selection = [entry.lower() for entry in set(input(prompt).split())]
 
-            selection = [entry.lower() for entry in set(input(prompt).split())]
+            except (EOFError, KeyboardInterrupt):
+                return None
 
-        except (EOFError, KeyboardInterrupt):
-            return None
+            if not selection:
+                continue
 
-        parameters = (folder_index, folder_name, mode, min_files, max_files)
+            if any((entry in ['b', 'back'] for entry in selection)):
+                return ['back']
 
-        return (
-            self._validate_file_choice(selection, *parameters)
-            if selection
-            else self._get_file_choice(*parameters)
-        )
+            files = self.file_list[folder_index][1]
+            numbers = (
+                [int(entry) for entry in selection]
+                if all(entry.isdecimal() for entry in selection)
+                else None
+            )
+
+            if message := self._validate_file_choice(
+                numbers, len(files), min_files, max_files
+            ):
+                self._print_files_in_folder(folder_index, folder_name)
+                print(f'\n{message}')
+                continue
+
+            return [files[number - 1] for number in sorted(numbers)]
 
     def _validate_file_choice(
         self,
-        selection: list[str],
-        folder_index: int,
-        folder_name: str,
-        mode: str,
+        numbers: list[int] | None,
+        n_files: int,
         min_files: int,
         max_files: int,
-    ) -> list[str]:
-        def reprompt_with_message(message: str) -> list[str] | None:
-            self._print_files_in_folder(folder_index, folder_name)
-            print(f'\n{message}')
-            return self._get_file_choice(
-                folder_index,
-                folder_name,
-                mode=mode,
-                min_files=min_files,
-                max_files=max_files,
-            )
-
-        if any((entry in ['b', 'back'] for entry in selection)):
-            return ['back']
-
-        accepted_range = range(1, len(self.file_list[folder_index][1]) + 1)
-
-        if any(
-            (
-                not entry.isdigit() or int(entry) not in accepted_range
-                for entry in selection
-            )
-        ):
-            message = (
+    ) -> str | None:
+        # Return a message explaining why the selection is invalid, or None.
+        # ``numbers`` is None if the selection contains anything but numbers.
+        if numbers is None or min(numbers) < 1 or max(numbers) > n_files:
+            return (
                 'Invalid selection. '
                 'Input a file number (shown in brackets) or b to go back.'
             )
-            return reprompt_with_message(message)
 
-        if len(selection) < min_files:
-            message = (
+        if len(numbers) < min_files:
+            return (
                 'Too few files selected. '
                 f'Select at least {min_files} {self.ext} file(s).'
             )
-            return reprompt_with_message(message)
 
-        if len(selection) > max_files:
-            message = (
+        if len(numbers) > max_files:
+            return (
                 f'Too many files selected. Select up to {max_files} {self.ext} file(s).'
             )
-            return reprompt_with_message(message)
 
-        return [
-            self.file_list[folder_index][1][int(entry) - 1]
-            for entry in sorted(selection)
-        ]
+        return None
 
     def _print_selection(self, file_names: list[str]) -> str:
-        max_length = max(len(max(file_names, key=len)) + 2, 19)
-
-        print('┏' + '┅' * max_length + '┓')
-        print(f'┇{"File(s) selected:":^{max_length}}┇')
+        max_length = max(max(map(len, file_names)) + 2, 19)
+        lines = ['┏' + '┅' * max_length + '┓', f'┇{"File(s) selected:":^{max_length}}┇']
 
         for file in file_names:
             right_padding = (max_length - len(file)) - 2
-            print('┇ ' + file + ' ' * right_padding + ' ┇')
+            lines.append('┇ ' + file + ' ' * right_padding + ' ┇')
 
-        print('┗' + '┅' * max_length + '┛')
+        lines.append('┗' + '┅' * max_length + '┛')
+        print('\n'.join(lines))
 
     def tree(self) -> None:
         """Print the root directory file tree to the console."""
-        print(self.root)
+        lines = [self.root]
         if self.file_list:
-            for index, entry in enumerate(self.file_list):
-                if index < len(self.file_list) - 1:
-                    print(f'├───{entry[0]}')
-                    for i, file in enumerate(entry[1]):
-                        if i < len(entry[1]) - 1:
-                            print(f'│   ├───{file}\t')
-                        else:
-                            print(f'│   └───{file}\t')
+            last_folder = len(self.file_list) - 1
+
+            for index, (folder, files) in enumerate(self.file_list):
+                if index < last_folder:
+                    lines.append(f'├───{folder}')
+                    prefix = '│   '
 
                 else:
-                    print(f'└───{entry[0]}')
-                    for i, file in enumerate(entry[1]):
-                        if i < len(entry[1]) - 1:
-                            print(f'    ├───{file}\t')
-                        else:
-                            print(f'    └───{file}\t')
+                    lines.append(f'└───{folder}')
+                    prefix = '    '
+
+                last_file = len(files) - 1
+                for i, file in enumerate(files):
+                    if i < last_file:
+                        lines.append(f'{prefix}├───{file}\t')
+                    else:
+                        lines.append(f'{prefix}└───{file}\t')
+
+        print('\n'.join(lines))
+
+
+def _scan_threads() -> int:
+    # Opt-in parallel scanning for slow (e.g., network) drives.
+    try:
+        return int(os.environ.get('UVP_SCAN_THREADS', '0'))
+
+    except ValueError:
+        return 0
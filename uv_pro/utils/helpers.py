@@ -7,10 +7,10 @@ Miscellaneous helper functions.
 from rich import print
 from rich.columns import Columns
 
-from uv_pro.const import CMAPS
-
 
 def list_colormaps():
+    from uv_pro.const import CMAPS
+
     link = 'https://matplotlib.org/stable/tutorials/colors/colormaps.html'
     basic_cmaps, reversible_cmaps = sort_reversible_colormaps(CMAPS.values())
     print(
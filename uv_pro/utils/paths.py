@@ -20,13 +20,13 @@ def ensure_extension(path: Path, ext: str) -> str:
 
 
 def resolve_path(path: Path, directories: list[Path], is_dir: bool = False) -> Path:
-    if path.is_absolute():
-        if (is_dir and path.is_dir()) or (not is_dir and path.is_file()):
-            return path.resolve()
+    # Joining an absolute path onto a directory returns the same path,
+    # so absolute paths only need to be checked once.
+    candidates = [path] if path.is_absolute() else [base / path for base in directories]
 
-    for base in directories:
-        candidate = base / path
-        if (is_dir and candidate.is_dir()) or (not is_dir and candidate.is_file()):
+    exists = Path.is_dir if is_dir else Path.is_file
+    for candidate in candidates:
+        if exists(candidate):
             return candidate.resolve()
 
     kind = 'directory' if is_dir else 'file'
@@ -37,7 +37,7 @@ def handle_args_path(args: argparse.Namespace, default_ext: str = '.KD') -> None
     args.path = ensure_extension(args.path, default_ext)
 
     search_dirs = [Path.cwd()]
-    if args.root_directory is not None:
+    if args.root_directory not in (None, search_dirs[0]):
         search_dirs.append(args.root_directory)
 
     args.path = resolve_path(args.path, search_dirs)
@@ -5,30 +5,43 @@ Helper functions for interactive terminal prompts.
 """
 
 from collections.abc import Sequence
+from functools import cache
 from typing import Any
 
 import questionary
 from questionary import Question, Style
 from rich import print
 
-from uv_pro.utils.config import PRIMARY_COLOR
+from uv_pro.utils import config
+
+
+@cache
+def _style() -> Style:
+    # Built on the first prompt. The config is not loaded on import.
+    primary = config.PRIMARY_COLOR
+    return Style(
+        [
+            ('qmark', f'fg:ansibright{primary} bold'),
+            ('question', 'bold'),
+            ('highlighted', f'fg:ansi{primary} bold'),
+            ('selected', f'fg:ansibright{primary} bg:ansiwhite bold'),
+            ('answer', f'fg:ansi{primary}'),
+            ('instruction', 'fg:ansibrightblack'),
+            ('pointer', f'fg:ansibright{primary}'),
+        ]
+    )
+
+
+def __getattr__(name: str):
+    if name == 'STYLE':
+        return _style()
 
-STYLE = Style(
-    [
-        ('qmark', f'fg:ansibright{PRIMARY_COLOR} bold'),
-        ('question', 'bold'),
-        ('highlighted', f'fg:ansi{PRIMARY_COLOR} bold'),
-        ('selected', f'fg:ansibright{PRIMARY_COLOR} bg:ansiwhite bold'),
-        ('answer', f'fg:ansi{PRIMARY_COLOR}'),
-        ('instruction', 'fg:ansibrightblack'),
-        ('pointer', f'fg:ansibright{PRIMARY_COLOR}'),
-    ]
-)
+    raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
 
 
 def _prompt(prompt_func: Question, message: str, **kwargs) -> Any:
     """Generic prompt function."""
-    question: Question = prompt_func(message, style=STYLE, **kwargs)
+    question: Question = prompt_func(message, style=_style(), **kwargs)
     print()
     return question.ask(kbi_msg='')
 